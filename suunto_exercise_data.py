@@ -1,13 +1,274 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import concurrent.futures
+import copy
+import datetime
+import functools
+import io
 import json
+import mmap
+import os
 import zipfile
-import glob
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _load_json(raw_data):
+    """
+    Parse a json document with the fastest parser available.
+
+    orjson is used if it is installed, else the json module of the standard
+    library.
+
+    Parameters
+    ----------
+    raw_data : bytes or mmap.mmap
+        The json document. A memory map is parsed without copying it into a
+        bytes object first if orjson is available.
+
+    Returns
+    -------
+    dict or list
+        The parsed json document.
+
+    """
+    if orjson is not None:
+        with memoryview(raw_data) as buffer:
+            return orjson.loads(buffer)
+    return json.loads(bytes(raw_data))
+
+
+def _read_json(json_file):
+    """
+    Parse a json document from a binary file object.
+
+    Files on disk are memory-mapped instead of being read into memory.
+
+    Parameters
+    ----------
+    json_file : file object
+        The json file opened in binary mode.
+
+    Returns
+    -------
+    dict or list
+        The parsed json document.
+
+    """
+    try:
+        file_number = json_file.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return _load_json(json_file.read())
+    with mmap.mmap(file_number, 0, access=mmap.ACCESS_READ) as json_buffer:
+        return _load_json(json_buffer)
+
+
+def _load_samples(samples_file, stream=False):
+    """
+    Get the entries of the 'Samples' array of a Suunto samples file.
+
+    Parameters
+    ----------
+    samples_file : file object
+        The samples file opened in binary mode. Must stay open until the
+        samples have been iterated.
+    stream : bool, optional
+        If True and ijson is available, the samples are streamed from the
+        file, so only a single sample is held in memory at a time. This is
+        slower than parsing the whole file by _read_json, which is done
+        otherwise. The default is False.
+
+    Returns
+    -------
+    list or iterable
+        The samples, a list unless they are streamed.
+
+    """
+    if stream and ijson is not None:
+        return ijson.items(samples_file, 'Samples.item', use_float=True)
+    return _read_json(samples_file)['Samples']
+
+
+def _append_to_columns(columns, sample_data, row_count):
+    """
+    Append the values of one sample to column-wise collected data.
+
+    Parameters
+    ----------
+    columns : dict
+        Maps the data keys to lists holding the values of all previous
+        samples. Is extended in place.
+    sample_data : dict
+        The 'Sample' entry of the current sample.
+    row_count : int
+        The number of samples already collected in columns.
+
+    Returns
+    -------
+    None.
+
+    """
+    for key, value in sample_data.items():
+        column = columns.get(key)
+        if column is None:
+            column = columns[key] = [np.nan] * row_count
+        column.append(value)
+    if len(sample_data) < len(columns):
+        for column in columns.values():
+            if len(column) == row_count:
+                column.append(np.nan)
+
+
+def _to_column_array(values):
+    """
+    Convert the collected values of one column to a numeric numpy array.
+
+    Handing typed arrays to pandas skips its dtype inference, which checks
+    every value of a list separately.
+
+    Parameters
+    ----------
+    values : list
+        The values of one column as collected by _append_to_columns.
+
+    Returns
+    -------
+    np.ndarray or list
+        A 1D int or float array if all values are numbers (with NaN for
+        missing values), else values itself.
+
+    """
+    try:
+        array = np.array(values)
+    except ValueError:  # nested data of different lengths
+        return values
+    # Nested data of equal lengths gives a multidimensional array.
+    if array.ndim == 1 and array.dtype.kind in 'fi':
+        return array
+    return values
+
+
+def _fast_to_datetime(time_strings):
+    """
+    Convert ISO 8601 time strings to a DatetimeIndex.
+
+    Each distinct string is parsed only once, which pays off because the
+    timestamps in Suunto files repeat frequently.
+
+    Parameters
+    ----------
+    time_strings : list of str
+        The time strings, e.g. the TimeISO8601 values of the samples.
+
+    Returns
+    -------
+    pd.DatetimeIndex
+        The parsed times in the order of time_strings.
+
+    """
+    codes, unique_strings = pd.factorize(
+        np.asarray(time_strings, dtype=object))
+    unique_times = pd.to_datetime(unique_strings, cache=True)
+    return unique_times.take(codes)
+
+
+def _to_seconds_index(time_strings):
+    """
+    Convert ISO 8601 time strings to a DatetimeIndex rounded to seconds.
+
+    Time strings in the layout written by Suunto watches, i.e.
+    'YYYY-MM-DDTHH:MM:SS.fff+HH:MM' with the same UTC offset throughout, are
+    converted by a bulk numpy cast of the local time part. The offset is
+    parsed only once. All other input is handled by _fast_to_datetime.
+
+    Parameters
+    ----------
+    time_strings : list of str
+        The time strings, e.g. the TimeISO8601 values of the samples.
+
+    Returns
+    -------
+    pd.DatetimeIndex
+        The parsed times rounded to seconds in the order of time_strings.
+
+    """
+    times = np.asarray(time_strings)
+    if times.dtype == np.dtype('U29'):
+        characters = times.view('U1').reshape(-1, 29)
+        offset = characters[0, 23:]
+        if ((characters[:, 19] == '.').all() and
+                characters[0, 23] in ('+', '-') and
+                (characters[:, 23:] == offset).all()):
+            local_times = times.astype('U23').astype(
+                'datetime64[ms]').astype('datetime64[ns]')
+            return pd.DatetimeIndex(local_times).round('S').tz_localize(
+                pd.Timestamp(time_strings[0]).tz)
+    return _fast_to_datetime(time_strings).round('S')
+
+
+def _write_parquet_cache(data, cache_path):
+    """
+    Store parsed exercise data in a Parquet file.
+
+    Parquet requires string column names, so the integer beat numbers of the
+    IBI_raw columns are stored as strings.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The parsed exercise data with MultiIndex columns.
+    cache_path : str
+        Path of the Parquet file.
+
+    Returns
+    -------
+    None.
+
+    """
+    data = data.set_axis(pd.MultiIndex.from_tuples(
+        [(group, str(key)) for group, key in data.columns]), axis=1)
+    data.to_parquet(cache_path, compression='zstd')
+
+
+def _read_parquet_cache(cache_path):
+    """
+    Load exercise data stored by _write_parquet_cache.
+
+    Parameters
+    ----------
+    cache_path : str
+        Path of the Parquet file.
+
+    Returns
+    -------
+    pd.DataFrame
+        The exercise data with the original column labels and time zone.
+
+    """
+    data = pd.read_parquet(cache_path)
+    data = data.set_axis(pd.MultiIndex.from_tuples(
+        [(group, int(key) if group == 'IBI_raw' else key)
+         for group, key in data.columns]), axis=1)
+    # The fixed UTC offset of the parsed timestamps is restored as a
+    # datetime.timezone, Parquet readers may return e.g. a pytz offset.
+    if data.index.tz is not None:
+        utc_offset = data.index.tz.utcoffset(None)
+        if utc_offset is not None:
+            data.index = data.index.tz_convert(datetime.timezone(utc_offset))
+    return data
+
 
 class exercise_data:
     """
@@ -20,11 +281,15 @@ class exercise_data:
     future). The data is stored in the Pandas DataDrame self.exercise_data.
     """
 
-    def __init__(self, file, mode='suunto_json'):
+    def __init__(self, file, mode='suunto_json', use_cache=False,
+                 parquet_cache=False, stream_samples=False):
         """
         Initialize instance of exercise_data.
 
         Some calculation on the data are performed directly after import.
+        Optionally, the parsed data of the most recently imported files is
+        cached, so importing the same unchanged file again does not parse it
+        again.
 
         Parameters
         ----------
@@ -36,6 +301,30 @@ class exercise_data:
             from the corresponding zip files, 'suunto_zip' for zip files found
             in the Suunto App folder and 'qs_json' for files exported from
             quantified-self.io. The default is 'suunto_json'.
+        use_cache : bool, optional
+            If True, the cache of parsed files is used. The cache is keyed by
+            the file path, the mode and the modification time of the file.
+            Each instance gets its own copy of the cached data, the raw and
+            unparsed samples are copied only when they are accessed. The
+            cache holds the parsed data of up to 32 files for the lifetime of
+            the process, so it only pays off if the same files are imported
+            repeatedly. The default is False.
+        parquet_cache : bool, optional
+            Only used for the modes 'suunto_json' and 'suunto_zip'. If True,
+            self.exercise_data is stored in a Parquet file next to file (with
+            '.parquet' appended to the file name) after parsing. In later
+            imports, it is loaded from there as long as the Parquet file is
+            newer than file. Requires pyarrow or fastparquet, if the Parquet
+            file cannot be written, the data is just not cached. Loaded data
+            contains only self.exercise_data and the summary, self.ibi_1d,
+            self.unparsed_data and self.unparsed_lines are None. The default
+            is False.
+        stream_samples : bool, optional
+            Only used for the modes 'suunto_json' and 'suunto_zip'. If True
+            and ijson is installed, the samples are streamed from the file
+            instead of parsing it at once, which is slower but uses less
+            memory. self.exercise_raw_data is None in this case. The default
+            is False.
 
         Returns
         -------
@@ -47,37 +336,117 @@ class exercise_data:
 
         self.import_modes = np.array(['suunto_json', 'suunto_zip', 'qs_json'])
 
-        if self.mode in self.import_modes[[0, 2]]:  # the json file modes
-            self.summary_raw_data = None
-            with open(self.file, 'r') as exercise_file:
-                self.exercise_raw_data = exercise_file.read()
+        if use_cache and self.mode in self.import_modes:
+            parsed_data = _parse_exercise_file(
+                os.path.abspath(self.file), self.mode,
+                os.path.getmtime(self.file), parquet_cache, stream_samples)
+            # The cached objects are copied, so changes to this instance do
+            # not affect the cache. Copying the sample dicts is expensive, so
+            # it is deferred to their first access, see __getattr__.
+            self._cached_samples = {}
+            for key, value in parsed_data.__dict__.items():
+                if isinstance(value, (list, dict)):
+                    self._cached_samples[key] = value
+                    continue
+                if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+                    value = value.copy()
+                setattr(self, key, value)
+            self.file = file
+            return
+
+        cache_path = self.file + '.parquet'
+        parquet_cache = parquet_cache and self.mode in self.import_modes[0:2]
+        if (parquet_cache and os.path.isfile(cache_path) and
+                os.path.getmtime(cache_path) >= os.path.getmtime(self.file)):
+            self.exercise_raw_data = None
+            self.exercise_data = _read_parquet_cache(cache_path)
+            self.ibi_1d = None
+            self.unparsed_data = None
+            self.unparsed_lines = None
+            return
+
+        # The samples are parsed while the file is open because they might be
+        # streamed from it.
+        if self.mode == 'suunto_json':
+            with open(self.file, 'rb') as exercise_file:
+                self.exercise_raw_data = _load_samples(
+                    exercise_file, stream_samples)
+                self.parse_sample_data()
+        elif self.mode == 'qs_json':
+            with open(self.file, 'rb') as exercise_file:
+                self.exercise_raw_data = _read_json(exercise_file)
+            self.parse_sample_data()
         elif self.mode == 'suunto_zip':
-            zip_data = zipfile.ZipFile(self.file, 'r')
-            self.summary_raw_data = json.loads(zip_data.read('summary.json'))[
-                'Samples']
-            self.exercise_raw_data = zip_data.read('samples.json')
+            with zipfile.ZipFile(self.file, 'r') as zip_data, zip_data.open(
+                    'samples.json') as exercise_file:
+                self.exercise_raw_data = _load_samples(
+                    exercise_file, stream_samples)
+                self.parse_sample_data()
         else:
             raise ValueError('No valid mode given. Allowed values must be in '
                              '{}.'.format(self.import_modes))
 
-        self.parse_sample_data()
-        self.parse_summary()
-
         # Some values are calculated from the raw data.
         if ('baro', 'Speed') in self.exercise_data.columns:
-            self.exercise_data[('gps', 'Pace')] = 1/self.exercise_data[
-                ('baro', 'Speed')]*1000/60
+            # Pace in min/km from speed in m/s, computed in a single pass
+            # with the constant factor folded. Zero speed gives inf.
+            speed = self.exercise_data[('baro', 'Speed')].to_numpy(
+                dtype=np.float64)
+            with np.errstate(divide='ignore'):
+                self.exercise_data[('gps', 'Pace')] = (1000/60) / speed
         if ('baro', 'Cadence') in self.exercise_data.columns:
             self.exercise_data[('baro', 'Cadence')] *= 60
 
+        if parquet_cache:
+            # A failed cache write must not discard the parsed data, e.g. if
+            # the folder is read-only, no Parquet engine is installed or a
+            # column cannot be stored in Parquet (pyarrow raises
+            # NotImplementedError for some types).
+            try:
+                _write_parquet_cache(self.exercise_data, cache_path)
+            except (OSError, ImportError, ValueError, TypeError,
+                    NotImplementedError):
+                try:
+                    os.remove(cache_path)
+                except OSError:  # not written or read-only folder
+                    pass
+
+    def __getattr__(self, name):
+        """
+        Copy the raw or unparsed samples taken from the cache on first access.
+
+        Only called for attributes that are not set on the instance.
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute.
+
+        Returns
+        -------
+        list or dict
+            A deep copy of the cached samples, stored as attribute name.
+
+        """
+        cached_samples = self.__dict__.get('_cached_samples', {})
+        if name not in cached_samples:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                type(self).__name__, name))
+        value = copy.deepcopy(cached_samples.pop(name))
+        setattr(self, name, value)
+        return value
+
     def parse_sample_data(self):
         """
-        Import the json file and parse it into a Pandas DataFrame.
+        Parse the imported json data into a Pandas DataFrame.
 
         (currently only for self.mode=='suunto_json' and 'suunto_zip', for
          'qs_json', basically only the raw data is imported). The data is
         stored in self.exercise_data. Unparsed data is stored in
         self.unparsed_data and can be inspected for possibly disregarded data.
+        For the Suunto modes, streamed raw samples can be iterated only once
+        and are not kept, so self.exercise_raw_data is None after parsing
+        them.
 
         Returns
         -------
@@ -85,92 +454,108 @@ class exercise_data:
 
         """
         if self.mode in self.import_modes[0:2]:  # 'suunto_json', 'suunto_zip'
-            self.exercise_raw_data = np.array(
-                json.loads(self.exercise_raw_data)['Samples'])
-
             # interbeat interval (ibi) is collected in lists together with
             # timestamp
             ibi_time = []
             ibi_values = []
             baro_time = []
-            baro_data = []
+            baro_data = {}
             gps_time = []
-            gps_data = []
-            processed_samples = []
-            for curr_index, curr_sample in enumerate(self.exercise_raw_data):
-                if 'R-R' in curr_sample['Attributes']['suunto/sml']:
-                    ibi_values.append(
-                        curr_sample['Attributes']['suunto/sml']['R-R']['IBI'])
-                    ibi_time.append(curr_sample['TimeISO8601'])
-                    processed_samples.append(curr_index)
-                elif 'Sample' in curr_sample['Attributes']['suunto/sml']:
-                    if 'AbsPressure' in curr_sample['Attributes'][
-                            'suunto/sml']['Sample']:
-                        baro_data.append(
-                            curr_sample['Attributes']['suunto/sml']['Sample'])
-                        baro_time.append(curr_sample['TimeISO8601'])
-                        processed_samples.append(curr_index)
-                    if 'Latitude' in curr_sample['Attributes']['suunto/sml'][
-                            'Sample']:
-                        gps_data.append(
-                            curr_sample['Attributes']['suunto/sml']['Sample'])
-                        gps_time.append(curr_sample['TimeISO8601'])
-                        processed_samples.append(curr_index)
-
-            ibi = pd.DataFrame(ibi_values, index=pd.to_datetime(ibi_time))
+            gps_data = {}
+            self.unparsed_data = []
+
+            # Bound methods and module level helpers are looked up once
+            # instead of once per sample.
+            append_to_columns = _append_to_columns
+            ibi_time_append = ibi_time.append
+            ibi_values_append = ibi_values.append
+            baro_time_append = baro_time.append
+            gps_time_append = gps_time.append
+            unparsed_data_append = self.unparsed_data.append
+            for curr_sample in self.exercise_raw_data:
+                sml = curr_sample['Attributes']['suunto/sml']
+                rr = sml.get('R-R')
+                if rr is not None:
+                    ibi_values_append(rr['IBI'])
+                    ibi_time_append(curr_sample['TimeISO8601'])
+                    continue
+                samp = sml.get('Sample')
+                if samp is not None:
+                    has_pressure = 'AbsPressure' in samp
+                    has_position = 'Latitude' in samp
+                    if has_pressure:
+                        append_to_columns(baro_data, samp, len(baro_time))
+                        baro_time_append(curr_sample['TimeISO8601'])
+                    if has_position:
+                        append_to_columns(gps_data, samp, len(gps_time))
+                        gps_time_append(curr_sample['TimeISO8601'])
+                    if has_pressure or has_position:
+                        continue
+                unparsed_data_append(curr_sample)
+            self.unparsed_lines = len(self.unparsed_data)
+            if not isinstance(self.exercise_raw_data, list):  # exhausted
+                self.exercise_raw_data = None
+
+            ibi = pd.DataFrame()
             if ibi_values:
-                ibi_cumsum = pd.to_timedelta(ibi.stack().cumsum(), unit='ms')
+                # The beat times are calculated as the cumulative sum of the
+                # interbeat intervals in ns, starting at the first R-R
+                # timestamp minus the intervals belonging to it.
+                ibi_flat = np.concatenate(ibi_values).astype(np.int64)
+                ibi_start = pd.Timestamp(ibi_time[0])
+                start_ns = ibi_start.value - sum(ibi_values[0]) * 1000000
                 ibi_timeindex = pd.to_datetime(
-                    ibi.index[0] -
-                    pd.Timedelta(ibi.iloc[0].sum(), unit='ms') +
-                    pd.to_timedelta(ibi_cumsum, unit='ms'))
+                    start_ns + ibi_flat.cumsum() * 1000000,
+                    utc=True).tz_convert(ibi_start.tz)
 
                 self.ibi_1d = pd.Series(
-                    ibi.stack().values, index=ibi_timeindex.round('S'))
-
-                index_array = np.ones_like(self.ibi_1d)
-                multi_index = pd.MultiIndex.from_arrays(
-                    [self.ibi_1d.index, index_array],
-                    names=('time', 'data_point'))
-                duplicate_indices = multi_index.duplicated(keep='first')
-                while True in duplicate_indices:
-                    index_array += duplicate_indices
-                    multi_index = pd.MultiIndex.from_arrays(
-                        [self.ibi_1d.index, index_array.astype(int)],
-                        names=('time', 'data_point'))
-                    duplicate_indices = multi_index.duplicated(keep='first')
-                ibi = self.ibi_1d
-                ibi.index = multi_index
-                ibi = ibi.unstack()
-                ibi.columns = pd.MultiIndex.from_product(
-                    [['IBI_raw'], ibi.columns])
-
+                    ibi_flat, index=ibi_timeindex.round('S'))
+
+            # The R-R samples might contain no beats at all.
+            if ibi_values and ibi_flat.size:
+                # The beats are arranged in a 2D array with one row per
+                # second and the beats falling into this second in
+                # consecutive columns.
+                row_codes, ibi_index = pd.factorize(
+                    self.ibi_1d.index, sort=True)
+                column_codes = self.ibi_1d.groupby(
+                    level=0).cumcount().to_numpy()
+                ibi_array = np.full(
+                    (len(ibi_index), column_codes.max() + 1), np.nan,
+                    dtype=np.float32)
+                ibi_array[row_codes, column_codes] = ibi_flat
+                ibi = pd.DataFrame(
+                    ibi_array, index=ibi_index,
+                    columns=pd.MultiIndex.from_product(
+                        [['IBI_raw'], range(1, ibi_array.shape[1] + 1)]))
+
+            # The columns are passed explicitly to get MultiIndex columns
+            # also if there is no data.
             baro = pd.DataFrame(
-                baro_data, index=pd.to_datetime(baro_time).round(freq='S'))
-            baro.columns = pd.MultiIndex.from_product([['baro'], baro.columns])
+                {('baro', key): _to_column_array(column)
+                 for key, column in baro_data.items()},
+                index=_to_seconds_index(baro_time),
+                columns=pd.MultiIndex.from_product([['baro'], baro_data]))
             gps = pd.DataFrame(
-                gps_data, index=pd.to_datetime(gps_time).round(freq='S'))
-            gps.columns = pd.MultiIndex.from_product([['gps'], gps.columns])
-
-            self.exercise_data = baro
-            for ii in [gps, ibi]:
-                if len(ii) > 0:
-                    self.exercise_data = self.exercise_data.join(ii)
-
-            self.exercise_data = self.exercise_data[
-                ~self.exercise_data.index.duplicated(keep='first')]
-
-            self.unparsed_lines = len(self.exercise_raw_data) - len(
-                processed_samples)
-            self.processed_samples_mask = np.ones_like(
-                self.exercise_raw_data, dtype=bool)
-            self.processed_samples_mask[processed_samples] = False
-            self.unparsed_data = self.exercise_raw_data[
-                self.processed_samples_mask]
+                {('gps', key): _to_column_array(column)
+                 for key, column in gps_data.items()},
+                index=_to_seconds_index(gps_time),
+                columns=pd.MultiIndex.from_product([['gps'], gps_data]))
+
+            # Samples rounded to the same second are removed before joining,
+            # the index of ibi is unique already.
+            baro = baro[~baro.index.duplicated(keep='first')]
+            gps = gps[~gps.index.duplicated(keep='first')]
+
+            # gps and ibi are aligned to the baro timestamps (like a left
+            # join) and all blocks are concatenated in a single call.
+            frames = [baro] + [curr_frame.reindex(baro.index)
+                               for curr_frame in [gps, ibi]
+                               if len(curr_frame) > 0]
+            self.exercise_data = pd.concat(frames, axis=1, copy=False)
 
         elif self.mode == self.import_modes[2]:  # 'qs_json'
             # currently very rudimentary
-            self.exercise_raw_data = json.loads(self.exercise_raw_data)
             self.ibi_values = np.array(
                 self.exercise_raw_data['activities'][0]['streams'][6]['data'])
 
@@ -179,39 +564,136 @@ class exercise_data:
                 'No valid mode entered. Allowed modes are {}'.format(
                     self.import_modes))
 
-    def parse_summary(self):
+    @functools.cached_property
+    def summary_raw_data(self):
         """
-        Generate a summary of the exercise data.
+        The raw summary data generated by the Suunto App/watch.
 
-        Currently only done if the mode is 'suunto_zip' because in this case,
-        the summary data generated by the Suunto App/watch is used.
+        Only available if the mode is 'suunto_zip', else None. summary.json
+        is read from the zip file on first access.
 
         Returns
         -------
-        None.
+        list or None
+            The 'Samples' entry of summary.json.
+
+        """
+        if self.mode == 'suunto_zip':
+            with zipfile.ZipFile(self.file, 'r') as zip_data:
+                return _load_json(zip_data.read('summary.json'))['Samples']
+        else:
+            return None
+
+    @functools.cached_property
+    def exercise_summary(self):
+        """
+        A summary of the exercise data.
+
+        Currently only generated if the mode is 'suunto_zip' because in this
+        case, the summary data generated by the Suunto App/watch is used. The
+        summary is generated on first access.
+
+        Returns
+        -------
+        pd.Series or None
+            The summary header of the exercise.
 
         """
         if self.mode == 'suunto_zip':
-            # self.exercise_summary = []
+            # exercise_summary = []
             # for curr_data in self.summary_raw_data[0:-1]:
-            #     self.exercise_summary.append(
+            #     exercise_summary.append(
             #         pd.Series(curr_data['Attributes']['suunto/sml']['Windows'][0]))
-            # self.exercise_summary.append(
+            # exercise_summary.append(
             #     pd.Series(self.summary_raw_data[-1]['Attributes']['suunto/sml']['Header']))
-            # self.exercise_summary = pd.concat(self.exercise_summary, axis=1)
-            self.exercise_summary = pd.Series(
+            # exercise_summary = pd.concat(exercise_summary, axis=1)
+            return pd.Series(
                 self.summary_raw_data[-1]['Attributes']['suunto/sml']['Header']
                 )
         else:
-            self.exercise_summary = None
+            return None
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_exercise_file(file, mode, mtime, parquet_cache, stream_samples):
+    """
+    Import a file into an exercise_data instance, caching the result.
+
+    Parameters
+    ----------
+    file : str
+        Absolute path to the file to be imported.
+    mode : str
+        The import mode, see exercise_data.
+    mtime : float
+        Modification time of file. Only used as part of the cache key, so
+        that a modified file is parsed again.
+    parquet_cache : bool
+        Passed on to exercise_data.
+    stream_samples : bool
+        Passed on to exercise_data.
+
+    Returns
+    -------
+    exercise_data
+        The imported data. Must not be modified by the caller.
+
+    """
+    return exercise_data(file, mode=mode, use_cache=False,
+                         parquet_cache=parquet_cache,
+                         stream_samples=stream_samples)
 
 
 class training_diary:
-    def __init__(self, folder, mode='suunto_zip'):
-        self.folder = folder
-        self.training_data_files = glob.glob(self.folder + '*.zip')
+    def __init__(self, folder, mode='suunto_zip', parquet_cache=False,
+                 n_jobs=1, stream_samples=False):
+        """
+        Import all zip files from the Suunto App folder.
 
-        self.training_data = []
-        for curr_file in tqdm(self.training_data_files):
-            self.training_data.append(
-                exercise_data(curr_file, mode='suunto_zip'))
+        Parameters
+        ----------
+        folder : str
+            Path to the folder containing the zip files.
+        mode : str, optional
+            Currently not used, all files are imported with the mode
+            'suunto_zip'. The default is 'suunto_zip'.
+        parquet_cache : bool, optional
+            Passed on to exercise_data. The default is False.
+        n_jobs : int, optional
+            Number of processes used for the import. If greater than 1, the
+            files are imported in parallel by a process pool with at most one
+            process per file. On platforms using the 'spawn' start method
+            (Windows, macOS), the calling script must then create the
+            training_diary inside an "if __name__ == '__main__':" block. The
+            default is 1, i.e. the files are imported sequentially.
+        stream_samples : bool, optional
+            Passed on to exercise_data. The default is False.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.folder = folder
+        # Like glob('*.zip'), hidden files are skipped.
+        with os.scandir(self.folder) as folder_entries:
+            self.training_data_files = [
+                curr_entry.path for curr_entry in folder_entries
+                if curr_entry.name.endswith('.zip') and
+                not curr_entry.name.startswith('.') and curr_entry.is_file()]
+
+        import_file = functools.partial(
+            exercise_data, mode='suunto_zip', parquet_cache=parquet_cache,
+            stream_samples=stream_samples)
+        n_jobs = min(n_jobs, len(self.training_data_files))
+        if n_jobs > 1:
+            # Parsing is CPU-bound, so processes are used instead of threads.
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=n_jobs) as executor:
+                self.training_data = list(tqdm(
+                    executor.map(import_file, self.training_data_files),
+                    total=len(self.training_data_files)))
+        else:
+            self.training_data = []
+            for curr_file in tqdm(self.training_data_files):
+                self.training_data.append(import_file(curr_file))